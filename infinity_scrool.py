@@ -1,35 +1,305 @@
-import sys
+import csv
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
 import time
 import argparse
 import re
 import random
-import pandas as pd
+from contextlib import closing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from urllib.parse import urlparse
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 
+# Walks the rendered listings from index arguments[0] onwards in one round-trip
+# and returns {total, cards}, where cards are plain {name, address} objects.
+# Each field tries its selector tiers in priority order, falling back to 'N/A'
+# when none match. Listings before the start index were extracted earlier.
+_EXTRACT_JS = """
+const first = (root, tiers) => {
+    for (const selector of tiers) {
+        const el = root.querySelector(selector);
+        if (el) return el.innerText.trim();
+    }
+    return 'N/A';
+};
+let cards = document.querySelectorAll('.store-details');
+if (!cards.length) cards = document.querySelectorAll('.resultbox, .listing-card, .business-card');
+return {
+    total: cards.length,
+    cards: Array.from(cards).slice(arguments[0]).map(card => ({
+        name: first(card, ['.lng_cont_name', '.fn.gray_btext a', 'h2, h3, .heading, [class*="name"], [class*="title"]']),
+        address: first(card, ['.cont_sw_addr', '.mrehover.gray_text', '[class*="address"], [class*="location"], .adr, address']),
+    })),
+};
+"""
+
+# Number of listing cards currently rendered
+_CARD_COUNT_JS = "return document.querySelectorAll('.store-details, .resultbox, .listing-card, .business-card').length"
+
+# Scrolls up to arguments[0] times, each time waiting (via MutationObserver, at
+# most arguments[1] ms) for more listing cards to render. With arguments[2]
+# set, each scroll is preceded by human-like partial scrolls and pauses.
+# Resolves with the number of scrolls that loaded new content.
+_AUTO_SCROLL_JS = """
+const [maxScrolls, waitMs, stealth, done] = arguments;
+const selector = '.store-details, .resultbox, .listing-card, .business-card';
+const count = () => document.querySelectorAll(selector).length;
+const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+const between = (lo, hi) => lo + Math.random() * (hi - lo);
+
+const grown = prev => new Promise(resolve => {
+    // Cards may already have loaded during the stealth pauses
+    if (count() > prev) return resolve(true);
+    let timer;
+    const observer = new MutationObserver(() => {
+        if (count() > prev) {
+            clearTimeout(timer);
+            observer.disconnect();
+            resolve(true);
+        }
+    });
+    observer.observe(document.body, {childList: true, subtree: true});
+    timer = setTimeout(() => {
+        observer.disconnect();
+        resolve(count() > prev);
+    }, waitMs);
+});
+
+(async () => {
+    let loaded = 0;
+    while (loaded < maxScrolls) {
+        const prev = count();
+        if (stealth) {
+            // Smooth scroll to 80-95% of the page, pause, maybe back up a little
+            window.scrollTo({top: document.body.scrollHeight * between(0.8, 0.95), behavior: 'smooth'});
+            await sleep(between(300, 800));
+            if (Math.random() < 0.3) {
+                window.scrollBy(0, -Math.round(between(100, 300)));
+                await sleep(between(300, 800));
+            }
+        }
+        window.scrollTo(0, document.body.scrollHeight);
+        if (!(await grown(prev))) break;
+        loaded++;
+    }
+    return loaded;
+})().then(done, () => done(0));
+"""
+
+# Requests the scraper never needs: images, web fonts, ads and analytics beacons.
+# Stylesheets are left alone since infinite scroll depends on the page layout.
+_BLOCKED_URLS = [
+    '*.jpg', '*.jpeg', '*.png', '*.webp', '*.gif', '*.svg',
+    '*.woff', '*.woff2', '*.ttf',
+    '*googletagmanager*', '*google-analytics*', '*doubleclick*',
+    '*googlesyndication*', '*.facebook.net/*', '*.hotjar.com/*',
+]
+
+# Where the last working chromedriver path is remembered, and for how long
+_DRIVER_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'infinity-scrool', 'driver.json')
+_DRIVER_CACHE_TTL = 7 * 24 * 3600
+
+# Same path within this process, so later scrapers skip the file entirely
+_driver_path = None
+
+def _load_driver_path():
+    """Return the cached chromedriver path, or None if missing, expired or stale"""
+    global _driver_path
+    if _driver_path and os.path.exists(_driver_path):
+        return _driver_path
+    try:
+        with open(_DRIVER_CACHE, encoding='utf-8') as f:
+            cached = json.load(f)
+        path, ts = cached.get('path'), float(cached.get('ts', 0))
+    except (OSError, ValueError, TypeError, AttributeError):
+        return None
+    if not path or time.time() - ts > _DRIVER_CACHE_TTL or not os.path.exists(path):
+        return None
+    _driver_path = path
+    return path
+
+def _save_driver_path(path, chrome_version=None):
+    """Remember a working chromedriver path for later scrapers and runs"""
+    global _driver_path
+    _driver_path = path
+    tmp_path = None
+    try:
+        # Write beside the cache and swap it in, so readers never see a partial file
+        os.makedirs(os.path.dirname(_DRIVER_CACHE), exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(_DRIVER_CACHE), suffix='.tmp', delete=False, encoding='utf-8') as f:
+            tmp_path = f.name
+            json.dump({'path': path, 'chrome_version': chrome_version, 'ts': time.time()}, f)
+        os.replace(tmp_path, _DRIVER_CACHE)
+    except OSError:
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+# Chrome profile reused across runs so JustDial's static assets stay cached.
+# It holds cookies, so it lives in the user's own cache, not the shared temp dir.
+_PROFILE_DIR = os.path.join(os.path.dirname(_DRIVER_CACHE), 'profile')
+
+def _lock_profile(profile_dir):
+    """
+    Claim a Chrome profile for this process without blocking
+
+    Chrome refuses to open a profile another browser is using, so concurrent
+    runs must not share one. The lock is released on close or process exit.
+
+    Returns:
+        file: Open lock file to keep for the profile's lifetime, or None if
+            another run holds the profile or the lock file cannot be opened
+    """
+    try:
+        os.makedirs(os.path.dirname(profile_dir), exist_ok=True)
+        handle = open(profile_dir + '.lock', 'a+')
+    except OSError:
+        return None
+    try:
+        if fcntl:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        handle.close()
+        return None
+    return handle
+
+_CSV_COLUMNS = ['datestamp', 'name', 'address', 'city']
+
+def _listing_hash(key):
+    """Stable signed 64-bit hash of a (name, address, city) listing key"""
+    digest = hashlib.blake2b('\x1f'.join(key).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+def _connect_key_index(filename):
+    """
+    Open (creating if needed) the sidecar key index of a CSV
+
+    The index is only a cache of the CSV, so an unreadable one is deleted and
+    recreated empty; having no signature, it is then rebuilt from the CSV.
+    """
+    path = filename + '.keys.sqlite'
+    for attempt in range(2):
+        index = sqlite3.connect(path)
+        try:
+            index.execute('CREATE TABLE IF NOT EXISTS seen (h INTEGER PRIMARY KEY, datestamp TEXT NOT NULL)')
+            index.execute('CREATE TABLE IF NOT EXISTS meta (k TEXT PRIMARY KEY, v TEXT NOT NULL)')
+            return index
+        except sqlite3.DatabaseError:
+            index.close()
+            if attempt:
+                raise
+            os.remove(path)
+
+def _sign_key_index(index, gz_path):
+    """Record which state of the .csv.gz the index describes"""
+    st = os.stat(gz_path)
+    index.execute("INSERT OR REPLACE INTO meta VALUES ('signature', ?)", (f'{st.st_size}:{st.st_mtime_ns}',))
+
+def _rebuild_key_index(index, gz_path, listings):
+    """Replace the index contents with (key, datestamp) pairs, keeping newer indexed datestamps"""
+    with index:
+        known = dict(index.execute('SELECT h, datestamp FROM seen'))
+        index.execute('DELETE FROM seen')
+        hashed = ((_listing_hash(key), datestamp) for key, datestamp in listings)
+        index.executemany(
+            'INSERT INTO seen VALUES (?, ?) ON CONFLICT(h) DO UPDATE SET datestamp = max(datestamp, excluded.datestamp)',
+            ((h, max(datestamp, known.get(h, ''))) for h, datestamp in hashed),
+        )
+        _sign_key_index(index, gz_path)
+
+def _open_key_index(filename):
+    """
+    Open the key index for filename's .csv.gz, rebuilding it if out of date
+
+    The index maps each listing's key hash to its datestamp, so saves never
+    need to read the CSV itself. If the CSV was changed by anything else, the
+    index is rebuilt from it once. Returns None if the CSV is not in the
+    current layout; raises FileNotFoundError if it does not exist.
+    """
+    gz_path = filename + '.gz'
+    st = os.stat(gz_path)
+    index = _connect_key_index(filename)
+    found = index.execute("SELECT v FROM meta WHERE k = 'signature'").fetchone()
+    if found and found[0] == f'{st.st_size}:{st.st_mtime_ns}':
+        return index
+
+    with gzip.open(gz_path, 'rt', newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames != _CSV_COLUMNS:
+            index.close()
+            return None
+        _rebuild_key_index(index, gz_path, (((r['name'], r['address'], r['city']), r['datestamp']) for r in reader))
+    return index
+
+def _split_address(addr):
+    """Split 'street, area, City' into ('street, area', 'City')"""
+    head, sep, tail = str(addr or '').strip().rpartition(',')
+    if sep:
+        return head.strip(), tail.strip()
+    return tail, ''
+
 class JustDialScraper:
-    def __init__(self, headless=True, timeout=10):
+    def __init__(self, headless=True, timeout=10, profile_dir=None, stealth=False, full_render=False):
         """
         Initialize the JustDial scraper with Chrome WebDriver
 
         Args:
             headless (bool): Run browser in headless mode
             timeout (int): Timeout for WebDriver waits
+            profile_dir (str): Persistent Chrome profile to reuse cookies and
+                HTTP cache across runs (a throwaway profile if None)
+            stealth (bool): Add human-like scrolling, hovering and pauses
+            full_render (bool): Load images, fonts and trackers like a normal
+                browser instead of blocking them
         """
         self.timeout = timeout
-        self.setup_driver(headless)
+        self.profile_dir = profile_dir
+        self.profile_lock = None
+        self.stealth = stealth
+        self.full_render = full_render
+
+        # Another run may have the persistent profile open; use a throwaway one
+        if profile_dir:
+            self.profile_lock = _lock_profile(profile_dir)
+            if self.profile_lock is None:
+                print("Browser profile is in use by another run or not accessible; starting with a fresh profile")
+                self.profile_dir = None
+
+        try:
+            self.setup_driver(headless)
+        except Exception:
+            if self.profile_lock:
+                self.profile_lock.close()
+            raise
 
     def setup_driver(self, headless=True):
         """Setup Chrome WebDriver with options"""
         chrome_options = Options()
+        # Return from driver.get() at DOMContentLoaded instead of the full load event
+        chrome_options.page_load_strategy = 'eager'
 
         if headless:
             chrome_options.add_argument('--headless')
@@ -37,24 +307,65 @@ class JustDialScraper:
         # Additional options for better performance and stability
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--window-size=1920,1080')
+
+        # Skip browser subsystems a scraper never uses
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-background-networking')
+        chrome_options.add_argument('--disable-sync')
+        chrome_options.add_argument('--disable-default-apps')
+        chrome_options.add_argument('--disable-renderer-backgrounding')
+        chrome_options.add_argument('--no-first-run')
+        chrome_options.add_argument('--no-default-browser-check')
+        chrome_options.add_argument('--mute-audio')
+        chrome_options.add_argument('--disable-features=Translate,MediaRouter,OptimizationHints,AcceptCHFrame')
+
+        # Skip image decoding unless the page should render like a normal browser.
+        # The pref is always set (1 = allow, 2 = block) since a persistent
+        # profile keeps whatever value an earlier run saved.
+        if not self.full_render:
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 1 if self.full_render else 2})
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
 
+        # Warm profile: static assets and cookies survive between runs
+        if self.profile_dir:
+            chrome_options.add_argument(f'--user-data-dir={self.profile_dir}')
+            chrome_options.add_argument('--disk-cache-size=104857600')
+
         # User agent to avoid detection
         chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
 
         try:
-            try:
-                service = Service()
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            except Exception:
-                service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.driver = None
+
+            # A chromedriver resolved recently needs no lookup or network check.
+            # If Chrome has since updated, the stale driver fails to start and
+            # the normal lookup below runs instead.
+            cached_path = _load_driver_path()
+            if cached_path:
+                try:
+                    self.driver = webdriver.Chrome(service=Service(cached_path), options=chrome_options)
+                except Exception:
+                    self.driver = None
+
+            if self.driver is None:
+                cached_path = None
+                try:
+                    service = Service()
+                    self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                except Exception:
+                    service = Service(ChromeDriverManager().install())
+                    self.driver = webdriver.Chrome(service=service, options=chrome_options)
             self.wait = WebDriverWait(self.driver, self.timeout)
 
+            # Block asset and tracker requests to cut page-load bandwidth
+            if not self.full_render:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+                self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URLS})
+
             # Execute script to avoid detection
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             version = None
@@ -68,13 +379,20 @@ class JustDialScraper:
             else:
                 print("Chrome WebDriver initialized successfully")
 
+            if not cached_path:
+                _save_driver_path(self.driver.service.path, version)
+
         except Exception as e:
             print(f"Error initializing WebDriver: {e}")
             raise
     
     def scroll_to_load_more(self, max_scrolls=10):
         """
-        Scroll down to trigger infinite scroll loading with human-like behavior
+        Scroll down to trigger infinite scroll loading
+
+        The whole scroll loop runs in the browser as one async script, waiting
+        on DOM mutations for new listings instead of polling from Python. In
+        stealth mode each scroll also behaves like a human reader.
 
         Args:
             max_scrolls (int): Maximum number of scroll attempts
@@ -82,61 +400,24 @@ class JustDialScraper:
         Returns:
             bool: True if new content was loaded
         """
-        initial_height = self.driver.execute_script("return document.body.scrollHeight")
-        scroll_count = 0
-
-        while scroll_count < max_scrolls:
-            # Random scroll distance (80-95% of page height) to appear more human
-            scroll_percentage = random.uniform(0.8, 0.95)
-            current_height = self.driver.execute_script("return document.body.scrollHeight")
-            scroll_position = int(current_height * scroll_percentage)
-            
-            # Smooth scroll with random speed
-            self.driver.execute_script(f"""
-                window.scrollTo({{
-                    top: {scroll_position},
-                    behavior: 'smooth'
-                }});
-            """)
-            
-            # Random delay to simulate reading (2-4 seconds)
-            time.sleep(random.uniform(2, 4))
-            
-            # Occasionally scroll back up a bit (like a human would)
-            if random.random() < 0.3:
-                scroll_back = random.randint(100, 300)
-                self.driver.execute_script(f"window.scrollBy(0, -{scroll_back});")
-                time.sleep(random.uniform(0.5, 1.5))
-            
-            # Scroll to actual bottom
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            
-            # Random wait for content to load (2-3 seconds)
-            time.sleep(random.uniform(2, 3))
-
-            # Check if new content was loaded
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-
-            if new_height == initial_height:
-                break
-            else:
-                initial_height = new_height
-                scroll_count += 1
+        # Each scroll takes at most ~1.6s of stealth pauses plus the 5s growth wait
+        self.driver.set_script_timeout(max_scrolls * 7 + 5)
+        loaded = self.driver.execute_async_script(_AUTO_SCROLL_JS, max_scrolls, 5000, self.stealth)
+        return bool(loaded)
 
-        return scroll_count > 0
-
-    def extract_business_data(self, store_element):
+    def extract_business_data(self, card, datestamp=None):
         """
-        Extract data from a single business listing element
+        Build a business record from one listing returned by the page walk
 
         Args:
-            store_element: WebElement containing business data
+            card (dict): Raw {name, address} values extracted in the browser
+            datestamp (str): ISO date to stamp the record with (default: today)
 
         Returns:
             dict: Extracted business data
         """
         business_data = {
-            'datestamp': datetime.now().date().isoformat(),
+            'datestamp': datestamp or datetime.now().date().isoformat(),
             'name': '',
             'address': '',
 #            'phone': '',
@@ -145,45 +426,44 @@ class JustDialScraper:
         }
 
         try:
-            # Extract business name
-            try:
-                name_element = store_element.find_element(By.CLASS_NAME, 'lng_cont_name')
-                business_data['name'] = name_element.text.strip()
-            except NoSuchElementException:
-                try:
-                    # Alternative selector for business name
-                    name_element = store_element.find_element(By.CSS_SELECTOR, '.fn.gray_btext a')
-                    business_data['name'] = name_element.text.strip()
-                except NoSuchElementException:
-                    # Try more generic selectors
-                    try:
-                        name_element = store_element.find_element(By.CSS_SELECTOR, 'h2, h3, .heading, [class*="name"], [class*="title"]')
-                        business_data['name'] = name_element.text.strip()
-                    except NoSuchElementException:
-                        business_data['name'] = 'N/A'
-
-            # Extract address 
-            try:
-                address_element = store_element.find_element(By.CLASS_NAME, 'cont_sw_addr')
-                business_data['address'] = address_element.text.strip()
-            except NoSuchElementException:
-                try:
-                    # Alternative selector for address
-                    address_element = store_element.find_element(By.CSS_SELECTOR, '.mrehover.gray_text')
-                    business_data['address'] = address_element.text.strip()
-                except NoSuchElementException:
-                    try:
-                        # Try more generic address selectors
-                        address_element = store_element.find_element(By.CSS_SELECTOR, '[class*="address"], [class*="location"], .adr, address')
-                        business_data['address'] = address_element.text.strip()
-                    except NoSuchElementException:
-                        business_data['address'] = 'N/A'
-
+            business_data['name'] = (card.get('name') or '').strip()
+            business_data['address'] = (card.get('address') or '').strip()
         except Exception as e:
             print(f"Error extracting data from business element: {e}")
 
         return business_data
 
+    def _navigate(self, url):
+        """Load the listing page once and dismiss any popups or overlays"""
+        self.driver.get(url)
+        self._wait_for_new_cards(0, timeout=self.timeout)
+
+        try:
+            popup_close = self.driver.find_element(By.CSS_SELECTOR, '.close, .popup-close, [data-dismiss="modal"]')
+            popup_close.click()
+            time.sleep(random.uniform(0.2, 0.5))
+        except NoSuchElementException:
+            pass
+
+    def _wait_for_new_cards(self, previous_count, timeout=5):
+        """
+        Wait until more than previous_count listing cards are rendered
+
+        Args:
+            previous_count (int): Number of cards already on the page
+            timeout (int): Maximum number of seconds to wait
+
+        Returns:
+            bool: True if new cards appeared before the timeout
+        """
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda d: d.execute_script(_CARD_COUNT_JS) > previous_count
+            )
+            return True
+        except TimeoutException:
+            return False
+
     def scrape_justdial(self, url, n=50):
         """
         Scrape business listings from JustDial
@@ -202,45 +482,34 @@ class JustDialScraper:
         print(f"Let the scraping begin...\n")
         
         try:
-            # Navigate to the URL
-            self.driver.get(url)
-            time.sleep(3)
-
-            # Handle any popups or overlays
-            try:
-                popup_close = self.driver.find_element(By.CSS_SELECTOR, '.close, .popup-close, [data-dismiss="modal"]')
-                popup_close.click()
-                time.sleep(1)
-            except NoSuchElementException:
-                pass
+            # Navigate once; every scroll below extends the same page
+            self._navigate(url)
 
             results = []
+            seen = set()
             previous_count = 0
             scroll_count = 0
+            stagnant = 0
 
             # Scroll to load content
             while scroll_count < num_scrolls:
                 try:
-                    # Find all business listing elements
-                    store_elements = self.driver.find_elements(By.CLASS_NAME, 'store-details')
-
-                    if not store_elements:
-                        # Alternative selectors
-                        store_elements = self.driver.find_elements(By.CSS_SELECTOR, '.resultbox, .listing-card, .business-card')
-
-                    current_count = len(store_elements)
-
-                    # Extract data from new elements
-                    for i in range(previous_count, current_count):
-                        if len(results) >= n:
-                            break
-                            
-                        business_data = self.extract_business_data(store_elements[i])
-                        
-                        # Only add valid entries (not empty, not N/A)
-                        if business_data['name'] and business_data['name'] != 'N/A' and business_data['name'].strip():
+                    # Extract only the listings rendered since the last pass, in a
+                    # single WebDriver call
+                    batch = self.driver.execute_script(_EXTRACT_JS, previous_count) or {}
+                    current_count = batch.get('total', previous_count)
+
+                    # Only add valid entries (not empty, not N/A), once each
+                    before = len(results)
+                    today = datetime.now().date().isoformat()
+                    for card in batch.get('cards', []):
+                        business_data = self.extract_business_data(card, today)
+                        key = (business_data['name'], business_data['address'])
+                        if business_data['name'] not in ('', 'N/A') and key not in seen:
+                            seen.add(key)
                             results.append(business_data)
-                            print(f"✓ [{len(results)}/{n}] {business_data['name']}")
+                    del results[n:]
+                    print(f"✓ [{len(results)}/{n}] +{len(results) - before} listings")
                     
                     # Check if we have enough results
                     if len(results) >= n:
@@ -248,19 +517,33 @@ class JustDialScraper:
                         break
                     
                     # Occasionally hover over random elements to appear human
-                    if current_count > 0 and random.random() < 0.4:
+                    if self.stealth and current_count > 0 and random.random() < 0.4:
                         try:
-                            random_element = random.choice(store_elements[:min(current_count, 10)])
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", random_element)
+                            self.driver.execute_script(
+                                "document.querySelectorAll('.store-details, .resultbox, .listing-card, .business-card')[arguments[0]]"
+                                ".scrollIntoView({block: 'center'});",
+                                random.randrange(min(current_count, 10)),
+                            )
                             time.sleep(random.uniform(0.3, 0.8))
                         except:
                             pass
 
-                    # Scroll for more content
-                    self.scroll_to_load_more(max_scrolls=1)
+                    # Scroll for more content, backing off while the page stops growing
+                    loaded = self.scroll_to_load_more(max_scrolls=1)
                     scroll_count += 1
                     previous_count = current_count
-                    time.sleep(random.uniform(1.5, 2.5))
+                    if loaded:
+                        stagnant = 0
+                    else:
+                        stagnant += 1
+                        if stagnant >= 3:
+                            print("\nNo more listings are loading")
+                            break
+                        # No point waiting if this was the last scroll
+                        if scroll_count < num_scrolls:
+                            time.sleep(min(4, 0.5 * 2 ** stagnant))
+                    if self.stealth:
+                        time.sleep(random.uniform(0.2, 0.5))
 
                 except Exception as e:
                     print(f"Error during scraping: {e}")
@@ -274,79 +557,132 @@ class JustDialScraper:
             return []
 
 
-    def save_to_csv(self, data, filename='data.csv'):
-        """Save scraped data to CSV (.csv.gz), appending and de-duplicating."""
-        if not data:
-            return
+    def scrape_many(self, urls, n=50):
+        """
+        Scrape several JustDial URLs one after another in this browser
 
-        new_df = pd.DataFrame(data)
-        new_df = new_df[['datestamp', 'name', 'address']]
+        Reusing the running browser saves a Chrome start-up per URL. Each URL
+        replaces the previous page, so the old listings' DOM is released.
 
-        def split_address(addr):
-            if pd.isna(addr):
-                return '', ''
-            text = str(addr).strip()
-            if ',' in text:
-                head, tail = text.rsplit(',', 1)
-                return head.strip(), tail.strip()
-            return text, ''
+        Args:
+            urls (list): JustDial URLs to scrape
+            n (int): Number of results to extract per URL (default: 50)
+
+        Yields:
+            tuple: (url, list of business data dictionaries) as each completes
+        """
+        for url in urls:
+            yield url, self.scrape_justdial(url, n=n)
 
-        addr_city = new_df['address'].apply(split_address)
-        new_df['address'] = addr_city.apply(lambda x: x[0])
-        new_df['city'] = addr_city.apply(lambda x: x[1])
+    @staticmethod
+    def save_to_csv(data, filename='data.csv'):
+        """
+        Save scraped data to CSV (.csv.gz), appending and de-duplicating.
 
-        existing_df = None
+        New listings are appended to the existing file without rewriting it,
+        using a sidecar key index (.keys.sqlite) instead of reading the CSV.
+        Listings already on disk only have their datestamp refreshed in the
+        index; compact_csv (--rebuild) writes those dates into the file. The
+        file is only compacted here when it needs migrating.
+        """
+        if not data:
+            return
+
+        # Valid, unique listings from this run, keyed like the file's de-dup key
+        rows = {}
+        for item in data:
+            name = str(item.get('name') or '').strip()
+            if not name or name == 'N/A':
+                continue
+            address, city = _split_address(item.get('address'))
+            key = (name, address, city)
+            rows[key] = max(rows.get(key, ''), item['datestamp'])
+
+        gz_path = filename + '.gz'
         try:
-            existing_df = pd.read_csv(filename + '.gz', encoding='utf-8')
+            index = _open_key_index(filename)
         except FileNotFoundError:
+            index = None
+        if index is None:
+            JustDialScraper.compact_csv(filename, data)
+            return
+
+        with closing(index):
+            # Append listings the file lacks; known ones are only refreshed in the index
+            fresh = [
+                (rows[key], *key) for key in sorted(rows)
+                if index.execute('SELECT 1 FROM seen WHERE h = ?', (_listing_hash(key),)).fetchone() is None
+            ]
+            if fresh:
+                with gzip.open(gz_path, 'at', newline='', encoding='utf-8') as f:
+                    csv.writer(f, lineterminator='\n').writerows(fresh)
+            with index:
+                index.executemany(
+                    'INSERT INTO seen VALUES (?, ?) ON CONFLICT(h) DO UPDATE SET datestamp = max(datestamp, excluded.datestamp)',
+                    ((_listing_hash(key), datestamp) for key, datestamp in rows.items()),
+                )
+                if fresh:
+                    _sign_key_index(index, gz_path)
+
+    @staticmethod
+    def compact_csv(filename='data.csv', data=None):
+        """Rewrite the CSV (.csv.gz) in full: merge in data, de-duplicate and sort."""
+        today = datetime.now().date().isoformat()
+
+        # Latest datestamp per (name, address, city)
+        listings = {}
+
+        def add(datestamp, name, address, city):
+            name = (name or '').strip()
+            if not name or name == 'N/A':
+                return
+            key = (name, (address or '').strip(), (city or '').strip())
+            listings[key] = max(listings.get(key, ''), (datestamp or '').strip() or today)
+
+        # Prefer the gzipped file, fall back to a legacy plain CSV
+        for path, opener in ((filename + '.gz', gzip.open), (filename, open)):
             try:
-                existing_df = pd.read_csv(filename, encoding='utf-8')
+                with opener(path, 'rt', newline='', encoding='utf-8') as f:
+                    reader = csv.DictReader(f)
+                    has_city = 'city' in (reader.fieldnames or [])
+                    for row in reader:
+                        if has_city:
+                            address, city = row.get('address'), row.get('city')
+                        else:
+                            address, city = _split_address(row.get('address'))
+                        add(row.get('datestamp'), row.get('name'), address, city)
+                break
             except FileNotFoundError:
-                existing_df = None
-            except pd.errors.EmptyDataError:
-                existing_df = None
-        except pd.errors.EmptyDataError:
-            existing_df = None
-
-        if existing_df is not None:
-            if 'datestamp' not in existing_df.columns:
-                existing_df['datestamp'] = datetime.now().date().isoformat()
-            if 'city' not in existing_df.columns:
-                ec = existing_df['address'].apply(split_address)
-                existing_df['address'] = ec.apply(lambda x: x[0])
-                existing_df['city'] = ec.apply(lambda x: x[1])
-            existing_df = existing_df[['datestamp', 'name', 'address', 'city']]
-            # Backfill empty/invalid datestamps in existing data
-            ds = existing_df['datestamp'].astype(str).str.strip()
-            mask_empty = ds.eq('') | ds.eq('nan') | ds.isna()
-            existing_df.loc[mask_empty, 'datestamp'] = datetime.now().date().isoformat()
-            combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-        else:
-            combined_df = new_df
+                continue
 
-        # Clean and de-duplicate
-        combined_df = combined_df[combined_df['name'].notna()]
-        combined_df = combined_df[combined_df['name'].str.strip() != '']
-        combined_df = combined_df[combined_df['name'] != 'N/A']
-        combined_df['address'] = combined_df['address'].fillna('').astype(str).str.strip()
-        combined_df['city'] = combined_df['city'].fillna('').astype(str).str.strip()
+        for item in data or []:
+            add(item.get('datestamp'), item.get('name'), *_split_address(item.get('address')))
 
-        # Normalize/backfill datestamp before sort
-        combined_df['datestamp'] = combined_df['datestamp'].astype(str).str.strip()
-        mask_empty_all = combined_df['datestamp'].eq('') | combined_df['datestamp'].eq('nan') | combined_df['datestamp'].isna()
-        combined_df.loc[mask_empty_all, 'datestamp'] = datetime.now().date().isoformat()
+        # Datestamps refreshed in the index since the file was last rewritten
+        if os.path.exists(filename + '.keys.sqlite'):
+            with closing(_connect_key_index(filename)) as index:
+                known = dict(index.execute('SELECT h, datestamp FROM seen'))
+            for key in listings:
+                listings[key] = max(listings[key], known.get(_listing_hash(key), ''))
 
-        combined_df = combined_df.sort_values(by='datestamp', ascending=False)
-        combined_df = combined_df.drop_duplicates(subset=['name', 'address', 'city'], keep='first')
-        combined_df = combined_df.sort_values(by='name')
-        combined_df = combined_df[['datestamp', 'name', 'address', 'city']]
+        # Save gzipped CSV, sorted by name
+        with gzip.open(filename + '.gz', 'wt', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(_CSV_COLUMNS)
+            writer.writerows((listings[key], *key) for key in sorted(listings))
 
-        # Save gzipped CSV
-        combined_df.to_csv(filename + '.gz', index=False, encoding='utf-8', compression='gzip')
+        with closing(_connect_key_index(filename)) as index:
+            _rebuild_key_index(index, filename + '.gz', listings.items())
 
     def close(self):
         if hasattr(self, 'driver'):
             self.driver.quit()
+        if self.profile_lock:
+            self.profile_lock.close()
+            self.profile_lock = None
+
+_NCT_SEGMENT_RE = re.compile(r'(?:^|/)nct-[^/]*')
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]+')
 
 def generate_filename_from_url(url):
     """
@@ -355,33 +691,30 @@ def generate_filename_from_url(url):
     Returns: Bangalore-Pg-Accommodations
     """
     try:
-        # Parse the URL path
-        parsed = urlparse(url)
-        path = parsed.path.strip('/')
-        
-        # Split by '/' and get the relevant parts
-        parts = path.split('/')
-        
-        # Filter out empty parts and 'nct-' identifiers
-        relevant_parts = []
-        for part in parts:
-            # Skip empty parts and nct identifiers
-            if part and not part.startswith('nct-'):
-                relevant_parts.append(part)
-        
-        # Join with hyphens
-        if relevant_parts:
-            filename = '-'.join(relevant_parts)
-            # Clean up any special characters
-            filename = re.sub(r'[^a-zA-Z0-9-]', '-', filename)
-            # Remove multiple consecutive hyphens
-            filename = re.sub(r'-+', '-', filename)
-            return filename.strip('-')
-        else:
-            return 'justdial_data'
+        # Drop 'nct-' identifier segments from the path, then turn every run of
+        # separators and special characters into a single hyphen
+        path = _NCT_SEGMENT_RE.sub('', urlparse(url).path)
+        return _NON_ALNUM_RE.sub('-', path).strip('-') or 'justdial_data'
     except:
         return 'justdial_data'
 
+def _scrape_urls(urls, n, headless, stealth=False, full_render=False, profile_dir=None):
+    """Scrape URLs one after another in a single browser, yielding (url, results)"""
+    scraper = JustDialScraper(headless=headless, profile_dir=profile_dir, stealth=stealth, full_render=full_render)
+    try:
+        yield from scraper.scrape_many(urls, n=n)
+    finally:
+        scraper.close()
+
+def _scrape_group(urls, n, headless, stealth=False, full_render=False):
+    """Scrape a group of URLs with one browser (runs inside a worker process)"""
+    return dict(_scrape_urls(urls, n, headless, stealth, full_render))
+
+def _read_url_file(path):
+    """Read URLs from a file, one per line; blank lines and # comments are skipped"""
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+
 def main():
     """Main function to run the scraper"""
     print('\n🌀 Infinity Scrool - JustDial Business Listings Scraper')
@@ -399,14 +732,24 @@ def main():
   
   Watch the magic happen (visible browser):
     python infinity_scrool.py "https://www.justdial.com/Bangalore/Hotels/" -n 200 --no-headless
+
+  Scroll like a human reader (slower, gentler on bot blockers):
+    python infinity_scrool.py "URL" --stealth
   
   Custom output filename:
     python infinity_scrool.py "URL" -n 150 --output my-custom-name
 
+  Several pages at once, in parallel browsers:
+    python infinity_scrool.py "URL1" "URL2" "URL3" --workers 3
+    python infinity_scrool.py --url-file urls.txt --workers 4
+
+  Sort a saved file and fill in the latest dates, without scraping:
+    python infinity_scrool.py --rebuild --output Bangalore-Hotels
+
 💡 Tips:
   • Results are saved to a CSV file. Filename is determined automatically based on the URL.
   • Our bot knows how to work with infinite scroll pages.  
-  • Scraper mimics human-like scrolling to play nicely with bot blockers.
+  • With --stealth, the scraper mimics human-like scrolling to play nicely with bot blockers.
   • Data is deduplicated and appended to existing files. Every time you run the program, you grow the dataset.
 
 🦹‍♀️ PRO TIP: Use this tool judiciously. DO NOT OVERDO IT! 
@@ -414,40 +757,91 @@ def main():
 With that said, happy and responsible scraping! ✨
 '''
     )
-    parser.add_argument('url', nargs='?', metavar='URL', help='JustDial URL to scrape (e.g., "https://www.justdial.com/Bangalore/Pg-Accommodations/")')
-    parser.add_argument('-n', type=int, default=50, metavar='NUM', help='number of results to extract (default: 50)')
+    parser.add_argument('urls', nargs='*', metavar='URL', help='one or more JustDial URLs to scrape (e.g., "https://www.justdial.com/Bangalore/Pg-Accommodations/")')
+    parser.add_argument('-n', type=int, default=50, metavar='NUM', help='number of results to extract per URL (default: 50)')
     parser.add_argument('--no-headless', action='store_true', help='show browser window while scraping')
-    parser.add_argument('--output', default=None, metavar='FILENAME', help='custom output filename without extension (auto-generated if not provided)')
+    parser.add_argument('--stealth', action='store_true', help='scroll, hover and pause like a human reader')
+    parser.add_argument('--full-render', action='store_true', help='load images, fonts and trackers instead of blocking them')
+    parser.add_argument('--output', default=None, metavar='FILENAME', help='custom output filename without extension (auto-generated if not provided); results from all URLs are merged into it')
+    parser.add_argument('--url-file', default=None, metavar='FILE', help='read additional URLs from a file, one per line')
+    parser.add_argument('--rebuild', action='store_true', help='rewrite output files in full: re-sort by name, fill in the latest datestamps and rebuild the key index; with --output and no URLs, rebuild that file without scraping')
+    parser.add_argument('--workers', type=int, default=1, metavar='NUM', help='number of browsers to run in parallel when scraping several URLs (default: 1)')
 
     args = parser.parse_args()
 
+    if args.url_file:
+        try:
+            args.urls += _read_url_file(args.url_file)
+        except OSError as e:
+            print(f"✗ Could not read URL file: {e}")
+            return
+
+    # --rebuild with just --output rewrites that file without scraping
+    if args.rebuild and args.output and not args.urls:
+        csv_filename = f'{args.output}.csv.gz'
+        if not (os.path.exists(csv_filename) or os.path.exists(f'{args.output}.csv')):
+            print(f"✗ No such file: {csv_filename}")
+            return
+        try:
+            JustDialScraper.compact_csv(f'{args.output}.csv')
+            print(f"✓ Rebuilt: {csv_filename}")
+        except Exception as e:
+            print(f"✗ Error rebuilding {csv_filename}: {e}")
+        return
+
     # If no URL provided, print friendly help and exit gracefully
-    if len(sys.argv) == 1:
+    if not args.urls:
         parser.print_help()
         return
 
-    # Generate filename from URL if not provided
-    if args.output is None:
-        output_filename = generate_filename_from_url(args.url)
-    else:
-        output_filename = args.output
-
-    scraper = JustDialScraper(headless=not args.no_headless)
+    headless = not args.no_headless
+    workers = max(1, min(args.workers, len(args.urls)))
+    scraped = {}
 
     try:
-        data = scraper.scrape_justdial(url=args.url, n=args.n)
-
-        csv_filename = f'{output_filename}.csv.gz'
-        # Pass base name without .gz; save_to_csv will add .gz
-        scraper.save_to_csv(data, f'{output_filename}.csv')
-        print(f"\n✓ Data saved to: {csv_filename}")
+        if workers == 1:
+            for url, data in _scrape_urls(args.urls, args.n, headless, args.stealth, args.full_render, _PROFILE_DIR):
+                scraped[url] = data
+        else:
+            # WebDriver is not thread-safe, so each browser gets its own process
+            # and works through its share of the URLs. Chrome locks its profile,
+            # so parallel browsers use throwaway ones.
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(_scrape_group, group, args.n, headless, args.stealth, args.full_render): group
+                    for group in (args.urls[i::workers] for i in range(workers))
+                }
+                for future in as_completed(futures):
+                    # A failed browser only loses its own group of URLs
+                    try:
+                        scraped.update(future.result())
+                    except Exception as e:
+                        print(f"\n✗ Error scraping {', '.join(futures[future])}: {e}")
 
     except KeyboardInterrupt:
         print("\n\n✗ Scraping interrupted by user")
     except Exception as e:
         print(f"\n✗ Error: {e}")
-    finally:
-        scraper.close()
+
+    # Merge results per output file; generate filename from URL if not provided
+    outputs = {}
+    for url in args.urls:
+        if url in scraped:
+            output_filename = args.output or generate_filename_from_url(url)
+            outputs.setdefault(output_filename, []).extend(scraped[url])
+
+    for output_filename, data in outputs.items():
+        csv_filename = f'{output_filename}.csv.gz'
+        # Pass base name without .gz; save_to_csv will add .gz
+        try:
+            if args.rebuild:
+                JustDialScraper.compact_csv(f'{output_filename}.csv', data)
+            else:
+                JustDialScraper.save_to_csv(data, f'{output_filename}.csv')
+            print(f"\n✓ Data saved to: {csv_filename}")
+        except Exception as e:
+            # Keep saving the other outputs
+            print(f"\n✗ Error saving {csv_filename}: {e}")
 
 if __name__ == "__main__":
     main()